@@ -5,6 +5,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import numpy as np
+import instrumentacao as perf
 
 # Configuração da página
 st.set_page_config(
@@ -14,6 +15,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Instrumentação de desempenho (ativa com DASHBOARD_PERF=1)
+perf.iniciar_rerun("app")
+
 # Estilos CSS personalizados
 st.markdown("""
     <style>
@@ -95,18 +99,24 @@ with st.sidebar:
 # Função para carregar dados
 @st.cache_data(ttl=3600)  # Cache de 1 hora
 def load_data(tickers, start_date, end_date, interval):
-    data = yf.download(
-        tickers=tickers,
-        start=start_date,
-        end=end_date,
-        interval=interval,
-        group_by='ticker'
-    )
+    perf.cache_miss("load_data")
+    with perf.span("yf.download"):
+        data = yf.download(
+            tickers=tickers,
+            start=start_date,
+            end=end_date,
+            interval=interval,
+            group_by='ticker'
+        )
+    if perf.ATIVO:
+        # Aproximação: tamanho do DataFrame em memória, não os bytes da resposta do Yahoo
+        perf.contar("bytes_dataframe", int(data.memory_usage(deep=True).sum()))
     return data
 
 # Carregar dados
 if selected_tickers:
-    with st.spinner("Carregando dados..."):
+    perf.cache_chamada("load_data")
+    with st.spinner("Carregando dados..."), perf.span("load_data"):
         stock_data = load_data(selected_tickers, start_date, end_date, interval)
     
     if stock_data.empty:
@@ -139,34 +149,35 @@ if selected_tickers:
             
             # Gráfico de preços
             st.subheader("Evolução dos Preços")
-            fig = go.Figure()
+            with perf.span("grafico.precos"):
+                fig = go.Figure()
             
-            for ticker in selected_tickers:
-                if ticker in stock_data:
-                    df = stock_data[ticker].reset_index()
-                    fig.add_trace(go.Scatter(
-                        x=df['Date'],
-                        y=df['Close'],
-                        name=ticker,
-                        line=dict(width=2),
-                        mode='lines'
-                    ))
+                for ticker in selected_tickers:
+                    if ticker in stock_data:
+                        df = stock_data[ticker].reset_index()
+                        fig.add_trace(go.Scatter(
+                            x=df['Date'],
+                            y=df['Close'],
+                            name=ticker,
+                            line=dict(width=2),
+                            mode='lines'
+                        ))
             
-            fig.update_layout(
-                hovermode="x unified",
-                xaxis_title="Data",
-                yaxis_title="Preço (R$)",
-                height=500,
-                margin=dict(l=20, r=20, t=30, b=20),
-                legend=dict(
-                    orientation="h",
-                    yanchor="bottom",
-                    y=1.02,
-                    xanchor="right",
-                    x=1
+                fig.update_layout(
+                    hovermode="x unified",
+                    xaxis_title="Data",
+                    yaxis_title="Preço (R$)",
+                    height=500,
+                    margin=dict(l=20, r=20, t=30, b=20),
+                    legend=dict(
+                        orientation="h",
+                        yanchor="bottom",
+                        y=1.02,
+                        xanchor="right",
+                        x=1
+                    )
                 )
-            )
-            st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig, use_container_width=True)
             
             # Dados em tabela
             st.subheader("Dados Históricos")
@@ -184,52 +195,54 @@ if selected_tickers:
                 df = df.reset_index()
                 
                 # Cálculo de indicadores técnicos
-                if show_advanced:
-                    # Média Móvel
-                    df['MA'] = df['Close'].rolling(window=moving_average).mean()
+                with perf.span("indicadores"):
+                    if show_advanced:
+                        # Média Móvel
+                        df['MA'] = df['Close'].rolling(window=moving_average).mean()
                     
-                    # RSI
-                    if show_rsi:
-                        delta = df['Close'].diff()
-                        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-                        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-                        rs = gain / loss
-                        df['RSI'] = 100 - (100 / (1 + rs))
+                        # RSI
+                        if show_rsi:
+                            delta = df['Close'].diff()
+                            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
+                            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+                            rs = gain / loss
+                            df['RSI'] = 100 - (100 / (1 + rs))
                     
-                    # MACD
-                    if show_macd:
-                        exp12 = df['Close'].ewm(span=12, adjust=False).mean()
-                        exp26 = df['Close'].ewm(span=26, adjust=False).mean()
-                        df['MACD'] = exp12 - exp26
-                        df['Signal'] = df['MACD'].ewm(span=9, adjust=False).mean()
+                        # MACD
+                        if show_macd:
+                            exp12 = df['Close'].ewm(span=12, adjust=False).mean()
+                            exp26 = df['Close'].ewm(span=26, adjust=False).mean()
+                            df['MACD'] = exp12 - exp26
+                            df['Signal'] = df['MACD'].ewm(span=9, adjust=False).mean()
                 
                 # Gráfico de candlesticks
                 st.subheader(f"Gráfico de Candles - {selected_ticker_ta}")
-                fig_candles = go.Figure()
+                with perf.span("grafico.candles"):
+                    fig_candles = go.Figure()
                 
-                fig_candles.add_trace(go.Candlestick(
-                    x=df['Date'],
-                    open=df['Open'],
-                    high=df['High'],
-                    low=df['Low'],
-                    close=df['Close'],
-                    name='Candles'
-                ))
-                
-                if show_advanced:
-                    fig_candles.add_trace(go.Scatter(
+                    fig_candles.add_trace(go.Candlestick(
                         x=df['Date'],
-                        y=df['MA'],
-                        name=f'Média Móvel ({moving_average} dias)',
-                        line=dict(color='orange', width=2)
+                        open=df['Open'],
+                        high=df['High'],
+                        low=df['Low'],
+                        close=df['Close'],
+                        name='Candles'
                     ))
                 
-                fig_candles.update_layout(
-                    height=500,
-                    xaxis_rangeslider_visible=False,
-                    margin=dict(l=20, r=20, t=30, b=20)
-                )
-                st.plotly_chart(fig_candles, use_container_width=True)
+                    if show_advanced:
+                        fig_candles.add_trace(go.Scatter(
+                            x=df['Date'],
+                            y=df['MA'],
+                            name=f'Média Móvel ({moving_average} dias)',
+                            line=dict(color='orange', width=2)
+                        ))
+                
+                    fig_candles.update_layout(
+                        height=500,
+                        xaxis_rangeslider_visible=False,
+                        margin=dict(l=20, r=20, t=30, b=20)
+                    )
+                    st.plotly_chart(fig_candles, use_container_width=True)
                 
                 # Gráficos de indicadores
                 if show_advanced:
@@ -238,75 +251,80 @@ if selected_tickers:
                     with col1:
                         if show_rsi:
                             st.subheader("Índice de Força Relativa (RSI)")
-                            fig_rsi = go.Figure()
-                            fig_rsi.add_trace(go.Scatter(
-                                x=df['Date'],
-                                y=df['RSI'],
-                                name='RSI',
-                                line=dict(color='purple', width=2)
-                            ))
-                            fig_rsi.add_hline(y=70, line_dash="dash", line_color="red")
-                            fig_rsi.add_hline(y=30, line_dash="dash", line_color="green")
-                            fig_rsi.update_layout(height=300, margin=dict(l=20, r=20, t=30, b=20))
-                            st.plotly_chart(fig_rsi, use_container_width=True)
+                            with perf.span("grafico.rsi"):
+                                fig_rsi = go.Figure()
+                                fig_rsi.add_trace(go.Scatter(
+                                    x=df['Date'],
+                                    y=df['RSI'],
+                                    name='RSI',
+                                    line=dict(color='purple', width=2)
+                                ))
+                                fig_rsi.add_hline(y=70, line_dash="dash", line_color="red")
+                                fig_rsi.add_hline(y=30, line_dash="dash", line_color="green")
+                                fig_rsi.update_layout(height=300, margin=dict(l=20, r=20, t=30, b=20))
+                                st.plotly_chart(fig_rsi, use_container_width=True)
                     
                     with col2:
                         if show_macd:
                             st.subheader("MACD")
-                            fig_macd = go.Figure()
-                            fig_macd.add_trace(go.Scatter(
-                                x=df['Date'],
-                                y=df['MACD'],
-                                name='MACD',
-                                line=dict(color='blue', width=2)
-                            ))
-                            fig_macd.add_trace(go.Scatter(
-                                x=df['Date'],
-                                y=df['Signal'],
-                                name='Signal',
-                                line=dict(color='orange', width=2)
-                            ))
-                            fig_macd.update_layout(height=300, margin=dict(l=20, r=20, t=30, b=20))
-                            st.plotly_chart(fig_macd, use_container_width=True)
+                            with perf.span("grafico.macd"):
+                                fig_macd = go.Figure()
+                                fig_macd.add_trace(go.Scatter(
+                                    x=df['Date'],
+                                    y=df['MACD'],
+                                    name='MACD',
+                                    line=dict(color='blue', width=2)
+                                ))
+                                fig_macd.add_trace(go.Scatter(
+                                    x=df['Date'],
+                                    y=df['Signal'],
+                                    name='Signal',
+                                    line=dict(color='orange', width=2)
+                                ))
+                                fig_macd.update_layout(height=300, margin=dict(l=20, r=20, t=30, b=20))
+                                st.plotly_chart(fig_macd, use_container_width=True)
         
         with tab3:
             st.header("Análise Comparativa")
             
             if len(selected_tickers) > 1:
                 # Normalização dos preços para comparação
-                norm_data = pd.DataFrame()
-                for ticker in selected_tickers:
-                    if ticker in stock_data:
-                        norm_data[ticker] = stock_data[ticker]['Close'] / stock_data[ticker]['Close'].iloc[0] * 100
+                with perf.span("norm_data"):
+                    norm_data = pd.DataFrame()
+                    for ticker in selected_tickers:
+                        if ticker in stock_data:
+                            norm_data[ticker] = stock_data[ticker]['Close'] / stock_data[ticker]['Close'].iloc[0] * 100
                 
                 # Gráfico comparativo
                 st.subheader("Desempenho Relativo (Base 100)")
-                fig_compare = px.line(
-                    norm_data.reset_index(),
-                    x='Date',
-                    y=selected_tickers,
-                    labels={'value': 'Desempenho (%)', 'variable': 'Ação'},
-                    height=500
-                )
-                fig_compare.update_layout(
-                    hovermode="x unified",
-                    margin=dict(l=20, r=20, t=30, b=20)
-                )
-                st.plotly_chart(fig_compare, use_container_width=True)
+                with perf.span("grafico.comparativo"):
+                    fig_compare = px.line(
+                        norm_data.reset_index(),
+                        x='Date',
+                        y=selected_tickers,
+                        labels={'value': 'Desempenho (%)', 'variable': 'Ação'},
+                        height=500
+                    )
+                    fig_compare.update_layout(
+                        hovermode="x unified",
+                        margin=dict(l=20, r=20, t=30, b=20)
+                    )
+                    st.plotly_chart(fig_compare, use_container_width=True)
                 
                 # Correlação entre ações
                 st.subheader("Matriz de Correlação")
-                corr_matrix = norm_data.corr()
-                fig_corr = px.imshow(
-                    corr_matrix,
-                    text_auto=True,
-                    color_continuous_scale='RdYlGn',
-                    zmin=-1,
-                    zmax=1,
-                    labels=dict(color="Correlação")
-                )
-                fig_corr.update_layout(height=500)
-                st.plotly_chart(fig_corr, use_container_width=True)
+                with perf.span("grafico.correlacao"):
+                    corr_matrix = norm_data.corr()
+                    fig_corr = px.imshow(
+                        corr_matrix,
+                        text_auto=True,
+                        color_continuous_scale='RdYlGn',
+                        zmin=-1,
+                        zmax=1,
+                        labels=dict(color="Correlação")
+                    )
+                    fig_corr.update_layout(height=500)
+                    st.plotly_chart(fig_corr, use_container_width=True)
             else:
                 st.warning("Selecione pelo menos 2 ações para comparação.")
 else:
@@ -314,6 +332,7 @@ else:
 # Carregar dados financeiros adicionais
 @st.cache_data(ttl=3600)  # Cache de 1 hora
 def load_financial_data():
+    perf.cache_miss("load_financial_data")
     # Exemplo de dados financeiros fictícios
     data = {
         'Ticker': ['PETR4.SA', 'VALE3.SA', 'ITUB4.SA', 'AAPL', 'MSFT'],
@@ -327,10 +346,12 @@ def load_financial_data():
         'Dividendos Crescimento (%)': [3, 5, 2, 1, 2]
     }
     return pd.DataFrame(data)
+perf.cache_chamada("load_financial_data")
 df_financial = load_financial_data()
 # Carregar dados de ações
 @st.cache_data(ttl=3600)  # Cache de 1 hora
 def load_stocks_data():
+    perf.cache_miss("load_stocks_data")
     # Exemplo de dados de ações fictícios
     data = {
         'Ticker': ['PETR4.SA', 'VALE3.SA', 'ITUB4.SA', 'AAPL', 'MSFT'],
@@ -339,6 +360,7 @@ def load_stocks_data():
         'Subsetor': ['Petróleo e Gás', 'Mineração de Ferro', 'Bancos', 'Hardware', 'Software']
     }
     return pd.DataFrame(data)
+perf.cache_chamada("load_stocks_data")
 df_stocks = load_stocks_data()
 # Exibir dados financeiros
 st.subheader("Dados Financeiros")
@@ -378,4 +400,7 @@ st.markdown("""
     <div style="text-align: center; color: #6c757d; font-size: 0.9em;">
         Stock Analysis Dashboard • Dados do Yahoo Finance • Atualizado em {date}
     </div>
-""".format(date=datetime.now().strftime("%d/%m/%Y %H:%M")), unsafe_allow_html=True)
\ No newline at end of file
+""".format(date=datetime.now().strftime("%d/%m/%Y %H:%M")), unsafe_allow_html=True)
+
+# Painel de desempenho (só aparece com DASHBOARD_PERF=1)
+perf.painel_debug(perf.finalizar_rerun(), "app")
@@ -0,0 +1,337 @@
+import os
+import json
+import time
+import threading
+from collections import deque
+from datetime import datetime
+
+# Instrumentação leve de desempenho para os dashboards (app.py e main.py).
+# Ative com a variável de ambiente DASHBOARD_PERF=1. Desativada, cada chamada
+# se resume a um teste de booleano, então pode ficar no código em produção.
+# DASHBOARD_PERF_JSONL=<arquivo> grava cada rerun finalizado em JSON lines.
+# Reruns cortados no meio (widget alterado, st.stop, exceção) são registrados
+# com 'interrompido': True quando a mesma sessão inicia o rerun seguinte ou,
+# se a sessão acabou, quando ficam DASHBOARD_PERF_ABERTO_S segundos sem atividade.
+# O 'total_s' desses reruns é só um limite inferior (vai até o último span ou
+# contador medido; 0 se falharam antes do primeiro), por isso eles ficam fora
+# de dashboard_rerun_seconds e do gráfico do painel.
+
+ATIVO = os.environ.get("DASHBOARD_PERF", "").lower() in ("1", "true", "sim", "yes")
+ARQUIVO_JSONL = os.environ.get("DASHBOARD_PERF_JSONL", "")
+
+
+def _ler_inteiro(variavel, padrao):
+    # Valor inválido não pode derrubar os dashboards na importação
+    try:
+        valor = int(os.environ.get(variavel, padrao))
+    except ValueError:
+        return padrao
+    return valor if valor > 0 else padrao
+
+
+MAX_HISTORICO = _ler_inteiro("DASHBOARD_PERF_HISTORICO", 200)
+MAX_IDADE_ABERTO = _ler_inteiro("DASHBOARD_PERF_ABERTO_S", 600)
+MAX_ABERTOS = 1000
+
+# Histórico compartilhado entre sessões (o módulo sobrevive aos reruns do Streamlit)
+_historico = deque(maxlen=MAX_HISTORICO)
+_lock = threading.Lock()
+# Totais acumulados desde o início do processo (só crescem), para o Prometheus
+_totais = {'reruns': {}, 'interrompidos': {}, 'spans': {}, 'contadores': {}}
+# Cada rerun do Streamlit roda em sua própria thread
+_local = threading.local()
+# Reruns ainda abertos por (app, sessão), para registrar os interrompidos
+_abertos = {}
+
+
+class _SpanNulo:
+    # Usado quando a instrumentação está desativada
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_SPAN_NULO = _SpanNulo()
+
+
+class _Span:
+    def __init__(self, rerun, nome):
+        self.rerun = rerun
+        self.nome = nome
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        duracao = time.perf_counter() - self.inicio
+        spans = self.rerun['spans']
+        total, chamadas = spans.get(self.nome, (0.0, 0))
+        spans[self.nome] = (total + duracao, chamadas + 1)
+        self.rerun['ultimo'] = time.perf_counter()
+        return False
+
+
+def _rerun_atual():
+    return getattr(_local, 'rerun', None)
+
+
+def _sessao_atual():
+    # Id da sessão do Streamlit; fora dele, a thread atual
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+    except ImportError:
+        ctx = None
+    if ctx is not None:
+        return ctx.session_id
+    return threading.get_ident()
+
+
+def iniciar_rerun(app):
+    """Abre a coleta de métricas de um rerun do script.
+
+    Se a sessão ainda tem um rerun aberto (o anterior não chegou ao fim do
+    script), ele é registrado como interrompido antes de abrir o novo.
+    """
+    if not ATIVO:
+        return
+    chave = (app, _sessao_atual())
+    inicio = time.perf_counter()
+    rerun = {
+        'app': app,
+        'chave': chave,
+        'inicio': inicio,
+        'ultimo': inicio,
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'spans': {},
+        'contadores': {},
+    }
+    with _lock:
+        pendentes = [_abertos.pop(chave, None), _rerun_atual()]
+        _abertos[chave] = rerun
+    _local.rerun = rerun
+
+    for pendente in pendentes + _varrer_abertos():
+        if pendente is not None:
+            _registrar(pendente, interrompido=True)
+
+
+def _varrer_abertos():
+    # Retira reruns abertos de sessões abandonadas: sem atividade há mais de
+    # MAX_IDADE_ABERTO segundos ou, acima de MAX_ABERTOS, os mais antigos
+    agora = time.perf_counter()
+    with _lock:
+        antigos = [chave for chave, rerun in _abertos.items()
+                   if agora - rerun['ultimo'] > MAX_IDADE_ABERTO]
+        excesso = len(_abertos) - len(antigos) - MAX_ABERTOS
+        if excesso > 0:
+            restantes = sorted((chave for chave in _abertos if chave not in antigos),
+                               key=lambda chave: _abertos[chave]['ultimo'])
+            antigos += restantes[:excesso]
+        return [_abertos.pop(chave) for chave in antigos]
+
+
+def span(nome):
+    """Mede o tempo de um trecho: `with span("yf.download"): ...`"""
+    rerun = _rerun_atual() if ATIVO else None
+    if rerun is None:
+        return _SPAN_NULO
+    return _Span(rerun, nome)
+
+
+def contar(nome, valor=1):
+    """Incrementa um contador do rerun atual."""
+    if not ATIVO:
+        return
+    rerun = _rerun_atual()
+    if rerun is not None:
+        rerun['contadores'][nome] = rerun['contadores'].get(nome, 0) + valor
+        rerun['ultimo'] = time.perf_counter()
+
+
+def cache_chamada(funcao):
+    # Chamar antes de uma função com @st.cache_data
+    contar(f"cache.{funcao}.chamadas")
+
+
+def cache_miss(funcao):
+    # Chamar dentro do corpo da função cacheada (só executa em cache miss)
+    contar(f"cache.{funcao}.misses")
+
+
+def finalizar_rerun():
+    """Fecha o rerun atual, guarda no histórico e retorna o registro."""
+    if not ATIVO:
+        return None
+    rerun = _rerun_atual()
+    if rerun is None:
+        return None
+    _local.rerun = None
+    with _lock:
+        if _abertos.get(rerun['chave']) is rerun:
+            del _abertos[rerun['chave']]
+    for pendente in _varrer_abertos():
+        _registrar(pendente, interrompido=True)
+    return _registrar(rerun, interrompido=False)
+
+
+def _registrar(rerun, interrompido):
+    # Um rerun varrido por inatividade ainda pode chegar a finalizar_rerun
+    with _lock:
+        if rerun.get('registrado'):
+            return None
+        rerun['registrado'] = True
+
+    contadores = dict(rerun['contadores'])
+    # Hits = chamadas que não executaram o corpo da função cacheada
+    for nome in list(contadores):
+        if nome.startswith("cache.") and nome.endswith(".chamadas"):
+            prefixo = nome[:-len(".chamadas")]
+            misses = contadores.get(f"{prefixo}.misses", 0)
+            contadores.setdefault(f"{prefixo}.misses", 0)
+            contadores[f"{prefixo}.hits"] = contadores[nome] - misses
+
+    registro = {
+        'app': rerun['app'],
+        'timestamp': rerun['timestamp'],
+        # Interrompido: limite inferior, até a última atividade medida
+        'total_s': (rerun['ultimo'] if interrompido else time.perf_counter()) - rerun['inicio'],
+        'interrompido': interrompido,
+        'spans': {nome: {'total_s': total, 'chamadas': chamadas}
+                  for nome, (total, chamadas) in rerun['spans'].items()},
+        'contadores': contadores,
+    }
+    with _lock:
+        _historico.append(registro)
+        _acumular(registro)
+        if ARQUIVO_JSONL:
+            try:
+                with open(ARQUIVO_JSONL, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(registro, ensure_ascii=False) + "\n")
+            except OSError:
+                pass
+    return registro
+
+
+def historico(app=None):
+    with _lock:
+        registros = list(_historico)
+    if app is not None:
+        registros = [r for r in registros if r['app'] == app]
+    return registros
+
+
+def exportar_jsonl(app=None):
+    """Histórico de reruns em JSON lines (um rerun por linha)."""
+    return "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in historico(app))
+
+
+def _nome_prometheus(nome):
+    return "".join(c if c.isalnum() else "_" for c in nome).strip("_").lower()
+
+
+def _acumular(registro):
+    # Chamar com _lock adquirido
+    app = registro['app']
+    if registro['interrompido']:
+        _totais['interrompidos'][app] = _totais['interrompidos'].get(app, 0) + 1
+    else:
+        total, qtd = _totais['reruns'].get(app, (0.0, 0))
+        _totais['reruns'][app] = (total + registro['total_s'], qtd + 1)
+        _totais['interrompidos'].setdefault(app, 0)
+    for nome, s in registro['spans'].items():
+        total, qtd = _totais['spans'].get((app, nome), (0.0, 0))
+        _totais['spans'][(app, nome)] = (total + s['total_s'], qtd + s['chamadas'])
+    for nome, valor in registro['contadores'].items():
+        chave = (app, nome)
+        _totais['contadores'][chave] = _totais['contadores'].get(chave, 0) + valor
+
+
+def exportar_prometheus(app=None):
+    """Totais acumulados do processo no formato de texto do Prometheus."""
+    with _lock:
+        totais_rerun = dict(_totais['reruns'])
+        interrompidos = dict(_totais['interrompidos'])
+        spans = dict(_totais['spans'])
+        contadores = dict(_totais['contadores'])
+    if app is not None:
+        totais_rerun = {a: v for a, v in totais_rerun.items() if a == app}
+        interrompidos = {a: v for a, v in interrompidos.items() if a == app}
+        spans = {k: v for k, v in spans.items() if k[0] == app}
+        contadores = {k: v for k, v in contadores.items() if k[0] == app}
+
+    linhas = [
+        "# HELP dashboard_rerun_seconds Duração dos reruns que chegaram ao fim do script.",
+        "# TYPE dashboard_rerun_seconds summary",
+    ]
+    for app_nome, (total, qtd) in sorted(totais_rerun.items()):
+        linhas.append(f'dashboard_rerun_seconds_sum{{app="{app_nome}"}} {total:.6f}')
+        linhas.append(f'dashboard_rerun_seconds_count{{app="{app_nome}"}} {qtd}')
+
+    linhas += [
+        "# HELP dashboard_reruns_interrompidos_total Reruns que não chegaram ao fim do script.",
+        "# TYPE dashboard_reruns_interrompidos_total counter",
+    ]
+    for app_nome, qtd in sorted(interrompidos.items()):
+        linhas.append(f'dashboard_reruns_interrompidos_total{{app="{app_nome}"}} {qtd}')
+
+    linhas += [
+        "# HELP dashboard_span_seconds Tempo gasto em cada etapa instrumentada.",
+        "# TYPE dashboard_span_seconds summary",
+    ]
+    for (app_nome, nome), (total, qtd) in sorted(spans.items()):
+        rotulos = f'app="{app_nome}",span="{nome}"'
+        linhas.append(f'dashboard_span_seconds_sum{{{rotulos}}} {total:.6f}')
+        linhas.append(f'dashboard_span_seconds_count{{{rotulos}}} {qtd}')
+
+    por_metrica = {}
+    for (app_nome, nome), valor in contadores.items():
+        metrica = f"dashboard_{_nome_prometheus(nome)}_total"
+        por_metrica.setdefault(metrica, []).append((app_nome, valor))
+    for metrica, valores in sorted(por_metrica.items()):
+        linhas.append(f"# TYPE {metrica} counter")
+        for app_nome, valor in sorted(valores):
+            linhas.append(f'{metrica}{{app="{app_nome}"}} {valor}')
+    return "\n".join(linhas) + "\n"
+
+
+def painel_debug(registro, app):
+    """Painel opcional na sidebar com as métricas do rerun e do histórico."""
+    if not ATIVO or registro is None:
+        return
+    import streamlit as st
+    import pandas as pd
+
+    with st.sidebar:
+        with st.expander("⏱️ Desempenho (debug)"):
+            st.metric("Tempo do rerun", f"{registro['total_s'] * 1000:.1f} ms")
+
+            spans_df = pd.DataFrame([
+                {'Etapa': nome, 'Tempo (ms)': s['total_s'] * 1000, 'Chamadas': s['chamadas']}
+                for nome, s in registro['spans'].items()
+            ])
+            if not spans_df.empty:
+                st.dataframe(spans_df.sort_values('Tempo (ms)', ascending=False),
+                             hide_index=True, use_container_width=True)
+
+            if registro['contadores']:
+                st.dataframe(pd.DataFrame(
+                    sorted(registro['contadores'].items()), columns=['Contador', 'Valor']
+                ), hide_index=True, use_container_width=True)
+
+            registros = historico(app)
+            completos = [r['total_s'] * 1000 for r in registros if not r['interrompido']]
+            if len(registros) > 1:
+                interrompidos = len(registros) - len(completos)
+                st.caption(f"Últimos {len(registros)} reruns, {interrompidos} interrompidos "
+                           f"(duração desconhecida, fora do gráfico)")
+            if len(completos) > 1:
+                st.line_chart(completos, height=120)
+
+            st.download_button("Exportar JSON lines", exportar_jsonl(app),
+                               file_name=f"{app}_desempenho.jsonl", mime="application/json")
+            st.download_button("Exportar Prometheus", exportar_prometheus(app),
+                               file_name=f"{app}_desempenho.prom", mime="text/plain")
@@ -9,6 +9,7 @@ from bs4 import BeautifulSoup
 import matplotlib.pyplot as plt
 from plotly.subplots import make_subplots
 import plotly.graph_objects as go
+import instrumentacao as perf
 
 # Configuração da página
 st.set_page_config(
@@ -18,6 +19,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Instrumentação de desempenho (ativa com DASHBOARD_PERF=1)
+perf.iniciar_rerun("main")
+
 # Estilos CSS personalizados
 st.markdown("""
     <style>
@@ -70,6 +74,7 @@ st.markdown("""
 # Dados de exemplo (na prática, você usaria uma API ou banco de dados)
 @st.cache_data
 def load_stock_data():
+    perf.cache_miss("load_stock_data")
     # Lista de ações brasileiras com dados fictícios para exemplo
     stocks = {
         'PETR4.SA': {'Nome': 'Petrobras', 'Setor': 'Energia', 'Subsetor': 'Petróleo e Gás'},
@@ -88,6 +93,7 @@ def load_stock_data():
 # Dados de dividendos e lucratividade (fictícios para exemplo)
 @st.cache_data
 def load_financial_data():
+    perf.cache_miss("load_financial_data")
     data = []
     tickers = ['PETR4.SA', 'VALE3.SA', 'ITUB4.SA', 'BBDC4.SA', 'BBAS3.SA', 
                'WEGE3.SA', 'RENT3.SA', 'TAEE11.SA', 'CPLE6.SA', 'ABEV3.SA']
@@ -111,9 +117,98 @@ def load_financial_data():
     
     return pd.DataFrame(data)
 
+# Métricas agregadas no cubo setorial
+METRICAS_CUBO = ['Dividend Yield (%)', 'Payout (%)', 'Lucro Líquido (R$ bi)',
+                 'Crescimento Lucro (%)', 'Dividendos Crescimento (%)']
+
+def _agregar(base, chaves):
+    grupos = base.groupby(chaves)[METRICAS_CUBO]
+    cubo = pd.concat({
+        'Média': grupos.mean(),
+        'Mediana': grupos.median(),
+        'P25': grupos.quantile(0.25),
+        'P75': grupos.quantile(0.75),
+        'Soma': grupos.sum(),
+        'N': grupos.count(),
+    }, axis=1)
+    # Colunas no formato (métrica, estatística)
+    return cubo.swaplevel(axis=1).sort_index(axis=1).sort_index()
+
+def _rank_setor(df, chaves):
+    # 1 = maior valor da métrica dentro do grupo
+    ranks = df.groupby(chaves)[METRICAS_CUBO].rank(ascending=False, method='min')
+    return ranks.astype('Int64').add_prefix('Rank Setor ')
+
+# Cubo Setor x Subsetor x Ano, calculado uma vez por carga de dados.
+# A chave do cache são os próprios DataFrames: se os dados forem recarregados,
+# o cubo é reconstruído junto.
+@st.cache_data
+def load_sector_cube(df_stocks, df_financial):
+    perf.cache_miss("load_sector_cube")
+    base = df_financial.merge(df_stocks[['Ticker', 'Nome', 'Setor', 'Subsetor']], on='Ticker')
+
+    # Resumo por ticker no período completo (usado pelos filtros da sidebar)
+    grupos = base.sort_values('Ano').groupby('Ticker')
+    resumo = grupos[METRICAS_CUBO].mean()
+    resumo['Anos'] = grupos.size()
+    resumo['Lucro Mínimo'] = grupos['Lucro Líquido (R$ bi)'].min()
+    resumo['Lucro Crescente'] = grupos['Lucro Líquido (R$ bi)'].apply(lambda lucros: lucros.is_monotonic_increasing).astype(bool)
+    resumo = resumo.join(grupos[['Nome', 'Setor', 'Subsetor']].first())
+    resumo = resumo.join(_rank_setor(resumo, 'Setor'))
+
+    # Somas e contagens acumuladas ano a ano de cada ticker: a média de qualquer
+    # período é a diferença entre duas colunas, sem group-by por rerun
+    por_ano = base.set_index(['Setor', 'Ticker', 'Ano'])[METRICAS_CUBO]
+    somas = por_ano.fillna(0).unstack('Ano', fill_value=0).sort_index(axis=1)
+    contagens = por_ano.notna().astype(int).unstack('Ano', fill_value=0).sort_index(axis=1)
+
+    return {
+        'anos': [int(ano) for ano in sorted(base['Ano'].unique())],
+        'setor_ano': _agregar(base, ['Setor', 'Ano']),
+        'subsetor_ano': _agregar(base, ['Setor', 'Subsetor', 'Ano']),
+        'ticker': resumo,
+        'setor_ticker': resumo.reset_index().set_index(['Setor', 'Ticker']).sort_index(),
+        'soma_acumulada': {metrica: somas[metrica].cumsum(axis=1) for metrica in METRICAS_CUBO},
+        'n_acumulado': {metrica: contagens[metrica].cumsum(axis=1) for metrica in METRICAS_CUBO},
+    }
+
+def fatiar_anos(tabela, ano_inicial, ano_final):
+    # 'Ano' é o último nível do índice ordenado, então o recorte é um slice
+    recorte = (slice(None),) * (tabela.index.nlevels - 1) + (slice(ano_inicial, ano_final),)
+    return tabela.loc[recorte, :]
+
+def media_periodo(tabela, metrica, ano_inicial, ano_final, nivel):
+    # Média exata do período a partir das somas e contagens de cada ano
+    fatia = fatiar_anos(tabela, ano_inicial, ano_final)[metrica]
+    totais = fatia.groupby(level=nivel)[['Soma', 'N']].sum()
+    return totais['Soma'] / totais['N']
+
+def ranking_periodo(cubo, metrica, ano_inicial, ano_final):
+    # Média e rank no setor de cada ticker no período, pelas somas acumuladas do cubo
+    soma, n = cubo['soma_acumulada'][metrica], cubo['n_acumulado'][metrica]
+    soma_periodo, n_periodo = soma[ano_final], n[ano_final]
+    anterior = cubo['anos'].index(ano_inicial) - 1
+    if anterior >= 0:
+        soma_periodo = soma_periodo - soma[cubo['anos'][anterior]]
+        n_periodo = n_periodo - n[cubo['anos'][anterior]]
+
+    ranking = cubo['setor_ticker'][['Nome', 'Subsetor']].copy()
+    ranking[metrica] = soma_periodo / n_periodo.where(n_periodo > 0)
+    # Tickers sem dados no período ficam fora do ranking
+    ranking = ranking.dropna(subset=[metrica])
+    rank_col = f"Rank Setor {metrica}"
+    ranking[rank_col] = ranking.groupby(level='Setor')[metrica].rank(ascending=False, method='min').astype('Int64')
+    return ranking
+
 # Carregar dados
-df_stocks = load_stock_data()
-df_financial = load_financial_data()
+perf.cache_chamada("load_stock_data")
+perf.cache_chamada("load_financial_data")
+perf.cache_chamada("load_sector_cube")
+with perf.span("carregar_dados"):
+    df_stocks = load_stock_data()
+    df_financial = load_financial_data()
+    cubo = load_sector_cube(df_stocks, df_financial)
+resumo_ticker = cubo['ticker']
 
 # Sidebar - Filtros e busca
 with st.sidebar:
@@ -143,44 +238,37 @@ with st.sidebar:
                                 ["Qualquer", "Sempre lucrativa", "Crescimento consistente"])
 
 # Aplicar filtros
-if search_term:
-    df_stocks_filtered = df_stocks[
-        df_stocks['Ticker'].str.contains(search_term.upper()) | 
-        df_stocks['Nome'].str.contains(search_term, case=False)
-    ]
-else:
-    df_stocks_filtered = df_stocks.copy()
+with perf.span("filtros.busca_setor"):
+    if search_term:
+        df_stocks_filtered = df_stocks[
+            df_stocks['Ticker'].str.contains(search_term.upper()) | 
+            df_stocks['Nome'].str.contains(search_term, case=False)
+        ]
+    else:
+        df_stocks_filtered = df_stocks.copy()
 
-if setor_selecionado != "Todos":
-    df_stocks_filtered = df_stocks_filtered[df_stocks_filtered['Setor'] == setor_selecionado]
+    if setor_selecionado != "Todos":
+        df_stocks_filtered = df_stocks_filtered[df_stocks_filtered['Setor'] == setor_selecionado]
 
 # Filtrar por dividend yield
-tickers_com_div_yield = df_financial.groupby('Ticker')['Dividend Yield (%)'].mean().reset_index()
-tickers_com_div_yield = tickers_com_div_yield[tickers_com_div_yield['Dividend Yield (%)'] >= min_div]['Ticker']
-df_stocks_filtered = df_stocks_filtered[df_stocks_filtered['Ticker'].isin(tickers_com_div_yield)]
+with perf.span("filtros.dividend_yield"):
+    tickers_com_div_yield = resumo_ticker.index[resumo_ticker['Dividend Yield (%)'] >= min_div]
+    df_stocks_filtered = df_stocks_filtered[df_stocks_filtered['Ticker'].isin(tickers_com_div_yield)]
 
 # Filtrar por anos pagando dividendos
-tickers_anos_div = df_financial.groupby('Ticker').size().reset_index(name='Anos')
-tickers_anos_div = tickers_anos_div[tickers_anos_div['Anos'] >= min_anos_div]['Ticker']
-df_stocks_filtered = df_stocks_filtered[df_stocks_filtered['Ticker'].isin(tickers_anos_div)]
+with perf.span("filtros.anos_dividendos"):
+    tickers_anos_div = resumo_ticker.index[resumo_ticker['Anos'] >= min_anos_div]
+    df_stocks_filtered = df_stocks_filtered[df_stocks_filtered['Ticker'].isin(tickers_anos_div)]
 
 # Filtrar por lucratividade
-if lucratividade == "Sempre lucrativa":
-    tickers_lucrativos = df_financial.groupby('Ticker')['Lucro Líquido (R$ bi)'].min().reset_index()
-    tickers_lucrativos = tickers_lucrativos[tickers_lucrativos['Lucro Líquido (R$ bi)'] > 0]['Ticker']
-    df_stocks_filtered = df_stocks_filtered[df_stocks_filtered['Ticker'].isin(tickers_lucrativos)]
-elif lucratividade == "Crescimento consistente":
-    # Verifica se houve crescimento ano a ano
-    def is_growing(ticker_df):
-        lucros = ticker_df.sort_values('Ano')['Lucro Líquido (R$ bi)'].values
-        return all(x <= y for x, y in zip(lucros, lucros[1:]))
-    
-    tickers_crescentes = []
-    for ticker in df_stocks_filtered['Ticker']:
-        ticker_df = df_financial[df_financial['Ticker'] == ticker]
-        if is_growing(ticker_df):
-            tickers_crescentes.append(ticker)
-    df_stocks_filtered = df_stocks_filtered[df_stocks_filtered['Ticker'].isin(tickers_crescentes)]
+with perf.span("filtros.lucratividade"):
+    if lucratividade == "Sempre lucrativa":
+        tickers_lucrativos = resumo_ticker.index[resumo_ticker['Lucro Mínimo'] > 0]
+        df_stocks_filtered = df_stocks_filtered[df_stocks_filtered['Ticker'].isin(tickers_lucrativos)]
+    elif lucratividade == "Crescimento consistente":
+        # Crescimento ano a ano já calculado no cubo
+        tickers_crescentes = resumo_ticker.index[resumo_ticker['Lucro Crescente']]
+        df_stocks_filtered = df_stocks_filtered[df_stocks_filtered['Ticker'].isin(tickers_crescentes)]
 
 # Página principal
 st.title("📈 Análise de Ações Brasileiras")
@@ -194,15 +282,18 @@ if not df_stocks_filtered.empty:
     st.subheader("Ações que Atendem aos Critérios")
     
     # Métricas resumidas
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Número de Ações", len(df_stocks_filtered))
-    with col2:
-        avg_div = df_financial[df_financial['Ticker'].isin(df_stocks_filtered['Ticker'])]['Dividend Yield (%)'].mean()
-        st.metric("Dividend Yield Médio", f"{avg_div:.2f}%")
-    with col3:
-        avg_payout = df_financial[df_financial['Ticker'].isin(df_stocks_filtered['Ticker'])]['Payout (%)'].mean()
-        st.metric("Payout Médio", f"{avg_payout:.2f}%")
+    with perf.span("metricas_resumo"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Número de Ações", len(df_stocks_filtered))
+        with col2:
+            # Média ponderada pelos anos = média sobre todas as linhas dos tickers filtrados
+            resumo_filtrado = resumo_ticker.loc[df_stocks_filtered['Ticker']]
+            avg_div = (resumo_filtrado['Dividend Yield (%)'] * resumo_filtrado['Anos']).sum() / resumo_filtrado['Anos'].sum()
+            st.metric("Dividend Yield Médio", f"{avg_div:.2f}%")
+        with col3:
+            avg_payout = (resumo_filtrado['Payout (%)'] * resumo_filtrado['Anos']).sum() / resumo_filtrado['Anos'].sum()
+            st.metric("Payout Médio", f"{avg_payout:.2f}%")
     
     # Tabela de ações
     st.dataframe(
@@ -230,75 +321,132 @@ if not df_stocks_filtered.empty:
         st.markdown(f"**Setor:** {stock_info['Setor']}")
         st.markdown(f"**Subsetor:** {stock_info['Subsetor']}")
         st.markdown(f"**Ticker:** {stock_info['Ticker']}")
-        st.markdown(f"**Dividend Yield:** {df_financial[df_financial['Ticker'] == selected_ticker]['Dividend Yield (%)'].mean():.2f}%")
-        st.markdown(f"**Payout:** {df_financial[df_financial['Ticker'] == selected_ticker]['Payout (%)'].mean():.2f}%")
-        st.markdown(f"**Lucro Líquido Médio (últimos 5 anos):** R$ {df_financial[df_financial['Ticker'] == selected_ticker]['Lucro Líquido (R$ bi)'].mean():.2f} bilhões")
-        st.markdown(f"**Crescimento do Lucro (últimos 5 anos):** {df_financial[df_financial['Ticker'] == selected_ticker]['Crescimento Lucro (%)'].mean():.2f}%")
-        st.markdown(f"**Crescimento dos Dividendos (últimos 5 anos):** {df_financial[df_financial['Ticker'] == selected_ticker]['Dividendos Crescimento (%)'].mean():.2f}%")
+        ticker_info = resumo_ticker.loc[selected_ticker]
+        total_setor = len(cubo['setor_ticker'].loc[stock_info['Setor']])
+        st.markdown(f"**Dividend Yield:** {ticker_info['Dividend Yield (%)']:.2f}%")
+        st.markdown(f"**Payout:** {ticker_info['Payout (%)']:.2f}%")
+        st.markdown(f"**Lucro Líquido Médio (últimos 5 anos):** R$ {ticker_info['Lucro Líquido (R$ bi)']:.2f} bilhões")
+        st.markdown(f"**Crescimento do Lucro (últimos 5 anos):** {ticker_info['Crescimento Lucro (%)']:.2f}%")
+        st.markdown(f"**Crescimento dos Dividendos (últimos 5 anos):** {ticker_info['Dividendos Crescimento (%)']:.2f}%")
+        st.markdown(f"**Posição no setor (Dividend Yield):** {ticker_info['Rank Setor Dividend Yield (%)']}º de {total_setor}")
         st.markdown("---")
         # Gráfico de lucros e dividendos
-        fig = make_subplots(rows=2, cols=1, subplot_titles=("Lucro Líquido (R$ bi)", "Dividendos (R$ bi)"))
-        lucro_data = df_financial[df_financial['Ticker'] == selected_ticker]
-        lucro_data = lucro_data.sort_values('Ano')
-        fig.add_trace(
-            go.Bar(x=lucro_data['Ano'], y=lucro_data['Lucro Líquido (R$ bi)'], name='Lucro Líquido', marker_color='blue'),
-            row=1, col=1
-        )
-        fig.add_trace(
-            go.Bar(x=lucro_data['Ano'], y=lucro_data['Dividendos Crescimento (%)'], name='Dividendos', marker_color='green'),
-            row=2, col=1
-        )
-        fig.update_layout(title_text=f"Lucro e Dividendos de {stock_info['Nome']}", height=600)
-        st.plotly_chart(fig, use_container_width=True)
+        with perf.span("grafico.lucro_dividendos"):
+            fig = make_subplots(rows=2, cols=1, subplot_titles=("Lucro Líquido (R$ bi)", "Dividendos (R$ bi)"))
+            lucro_data = df_financial[df_financial['Ticker'] == selected_ticker]
+            lucro_data = lucro_data.sort_values('Ano')
+            fig.add_trace(
+                go.Bar(x=lucro_data['Ano'], y=lucro_data['Lucro Líquido (R$ bi)'], name='Lucro Líquido', marker_color='blue'),
+                row=1, col=1
+            )
+            fig.add_trace(
+                go.Bar(x=lucro_data['Ano'], y=lucro_data['Dividendos Crescimento (%)'], name='Dividendos', marker_color='green'),
+                row=2, col=1
+            )
+            fig.update_layout(title_text=f"Lucro e Dividendos de {stock_info['Nome']}", height=600)
+            st.plotly_chart(fig, use_container_width=True)
         # Gráfico de dividend yield
-        fig2 = px.line(
-            df_financial[df_financial['Ticker'] == selected_ticker],
-            x='Ano',
-            y='Dividend Yield (%)',
-            title=f"Dividend Yield de {stock_info['Nome']}",
-            labels={'Dividend Yield (%)': 'Dividend Yield (%)', 'Ano': 'Ano'},
-            markers=True
-        )
-        fig2.update_traces(marker=dict(size=10))
-        fig2.update_layout(yaxis_tickformat='%')
-        st.plotly_chart(fig2, use_container_width=True)
+        with perf.span("grafico.dividend_yield"):
+            fig2 = px.line(
+                df_financial[df_financial['Ticker'] == selected_ticker],
+                x='Ano',
+                y='Dividend Yield (%)',
+                title=f"Dividend Yield de {stock_info['Nome']}",
+                labels={'Dividend Yield (%)': 'Dividend Yield (%)', 'Ano': 'Ano'},
+                markers=True
+            )
+            fig2.update_traces(marker=dict(size=10))
+            fig2.update_layout(yaxis_tickformat='%')
+            st.plotly_chart(fig2, use_container_width=True)
         # Gráfico de payout
-        fig3 = px.line(
-            df_financial[df_financial['Ticker'] == selected_ticker],
-            x='Ano',
-            y='Payout (%)',
-            title=f"Payout de {stock_info['Nome']}",
-            labels={'Payout (%)': 'Payout (%)', 'Ano': 'Ano'},
-            markers=True
-        )
-        fig3.update_traces(marker=dict(size=10))
-        fig3.update_layout(yaxis_tickformat='%')
-        st.plotly_chart(fig3, use_container_width=True)
+        with perf.span("grafico.payout"):
+            fig3 = px.line(
+                df_financial[df_financial['Ticker'] == selected_ticker],
+                x='Ano',
+                y='Payout (%)',
+                title=f"Payout de {stock_info['Nome']}",
+                labels={'Payout (%)': 'Payout (%)', 'Ano': 'Ano'},
+                markers=True
+            )
+            fig3.update_traces(marker=dict(size=10))
+            fig3.update_layout(yaxis_tickformat='%')
+            st.plotly_chart(fig3, use_container_width=True)
         # Gráfico de crescimento do lucro
-        fig4 = px.line(
-            df_financial[df_financial['Ticker'] == selected_ticker],
-            x='Ano',
-            y='Crescimento Lucro (%)',
-            title=f"Crescimento do Lucro de {stock_info['Nome']}",
-            labels={'Crescimento Lucro (%)': 'Crescimento do Lucro (%)', 'Ano': 'Ano'},
-            markers=True
-        )
-        fig4.update_traces(marker=dict(size=10))
-        fig4.update_layout(yaxis_tickformat='%')
-        st.plotly_chart(fig4, use_container_width=True)
+        with perf.span("grafico.crescimento_lucro"):
+            fig4 = px.line(
+                df_financial[df_financial['Ticker'] == selected_ticker],
+                x='Ano',
+                y='Crescimento Lucro (%)',
+                title=f"Crescimento do Lucro de {stock_info['Nome']}",
+                labels={'Crescimento Lucro (%)': 'Crescimento do Lucro (%)', 'Ano': 'Ano'},
+                markers=True
+            )
+            fig4.update_traces(marker=dict(size=10))
+            fig4.update_layout(yaxis_tickformat='%')
+            st.plotly_chart(fig4, use_container_width=True)
         # Gráfico de crescimento dos dividendos
-        fig5 = px.line(
-            df_financial[df_financial['Ticker'] == selected_ticker],
-            x='Ano',
-            y='Dividendos Crescimento (%)',
-            title=f"Crescimento dos Dividendos de {stock_info['Nome']}",
-            labels={'Dividendos Crescimento (%)': 'Crescimento dos Dividendos (%)', 'Ano': 'Ano'},
-            markers=True
-        )
-        fig5.update_traces(marker=dict(size=10))
-        fig5.update_layout(yaxis_tickformat='%')
-        st.plotly_chart(fig5, use_container_width=True) 
-       
+        with perf.span("grafico.crescimento_dividendos"):
+            fig5 = px.line(
+                df_financial[df_financial['Ticker'] == selected_ticker],
+                x='Ano',
+                y='Dividendos Crescimento (%)',
+                title=f"Crescimento dos Dividendos de {stock_info['Nome']}",
+                labels={'Dividendos Crescimento (%)': 'Crescimento dos Dividendos (%)', 'Ano': 'Ano'},
+                markers=True
+            )
+            fig5.update_traces(marker=dict(size=10))
+            fig5.update_layout(yaxis_tickformat='%')
+            st.plotly_chart(fig5, use_container_width=True) 
+
+# Comparativo entre setores (mercado completo, independente dos filtros da sidebar)
+st.markdown("---")
+st.subheader("Comparativo Setorial")
+with perf.span("comparativo_setorial"):
+    anos = cubo['anos']
+    col1, col2 = st.columns(2)
+    with col1:
+        metrica_setor = st.selectbox("Métrica", METRICAS_CUBO)
+    with col2:
+        ano_inicial, ano_final = st.select_slider("Período", options=anos, value=(anos[0], anos[-1]))
+
+    media_setor = media_periodo(cubo['setor_ano'], metrica_setor, ano_inicial, ano_final, 'Setor')
+    fig_setor = px.bar(
+        media_setor.sort_values(ascending=False).reset_index(name=metrica_setor),
+        x='Setor',
+        y=metrica_setor,
+        title=f"{metrica_setor} médio por setor ({ano_inicial}-{ano_final})"
+    )
+    st.plotly_chart(fig_setor, use_container_width=True)
+
+    # Distribuição por setor e ano
+    st.dataframe(
+        fatiar_anos(cubo['setor_ano'], ano_inicial, ano_final)[metrica_setor][['Média', 'Mediana', 'P25', 'P75']].reset_index(),
+        use_container_width=True,
+        hide_index=True
+    )
+
+    # Drill-down: setor -> subsetor -> ticker
+    setor_detalhe = st.selectbox("Detalhar setor", cubo['setor_ticker'].index.get_level_values('Setor').unique().tolist())
+    media_subsetor = media_periodo(cubo['subsetor_ano'].loc[setor_detalhe], metrica_setor, ano_inicial, ano_final, 'Subsetor')
+    st.dataframe(media_subsetor.reset_index(name=metrica_setor), use_container_width=True, hide_index=True)
+
+    # Tickers do setor com média e rank no período selecionado
+    rank_col = f"Rank Setor {metrica_setor}"
+    ranking = ranking_periodo(cubo, metrica_setor, ano_inicial, ano_final)
+    st.dataframe(
+        ranking.loc[setor_detalhe].sort_values(rank_col),
+        use_container_width=True
+    )
+
+    # Top N de cada setor no mercado todo, no mesmo período
+    top_n = st.slider("Top N por setor", 1, 10, 3)
+    top_setor = ranking[ranking[rank_col] <= top_n].reset_index().sort_values(['Setor', rank_col])
+    st.dataframe(
+        top_setor[['Setor', rank_col, 'Ticker', 'Nome', 'Subsetor', metrica_setor]],
+        use_container_width=True,
+        hide_index=True
+    )
+
 # Rodapé
 st.markdown("---")
 st.markdown("### Sobre o Aplicativo")
@@ -314,7 +462,5 @@ st.markdown("""
     [fernanfds@yahoo.com.br](mailto:fernanfds@yahoo.com.br)
     """)
 
-
-
-
-        
\ No newline at end of file
+# Painel de desempenho (só aparece com DASHBOARD_PERF=1)
+perf.painel_debug(perf.finalizar_rerun(), "main")